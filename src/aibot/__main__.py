@@ -9,6 +9,7 @@ load_dotenv()
 
 from src.aibot.discord.client import BotClient  # noqa: E402
 from src.aibot.discord.commands import *  # noqa: E402, F403,
+from src.aibot.infrastructure.dao.base import ConnectionPool  # noqa: E402
 from src.aibot.infrastructure.dao.connection import ConnectionDAO  # noqa: E402
 from src.aibot.infrastructure.dao.instruction import InstructionDAO  # noqa: E402
 from src.aibot.infrastructure.dao.usage import UsageDAO  # noqa: E402
@@ -17,24 +18,33 @@ from src.aibot.services.scheduler import TaskScheduler  # noqa: E402
 
 
 async def main() -> None:  # noqa: D103
-    # Create database tables
-    await ConnectionDAO().create_tables()
-    await InstructionDAO().create_table()
-    await UsageDAO().create_tables()
-
-    DISCORD_BOT_TOKEN: str = os.environ["DISCORD_BOT_TOKEN"]  # noqa: N806
-
-    client = BotClient.get_instance()
-
-    # Start all background schedulers
-    TaskScheduler.start_all()
+    # Open pooled database connections
+    await ConnectionPool.get_instance().open()
 
+    # Close the pool even if startup fails, as its worker threads keep the process alive
     try:
-        await client.start(DISCORD_BOT_TOKEN)
-    except Exception:
-        logger.exception("Failed to start bot")
+        # Create database tables
+        await ConnectionDAO().create_tables()
+        await InstructionDAO().create_table()
+        await UsageDAO().create_tables()
+
+        DISCORD_BOT_TOKEN: str = os.environ["DISCORD_BOT_TOKEN"]  # noqa: N806
+
+        client = BotClient.get_instance()
+
+        # Start all background schedulers
+        TaskScheduler.start_all()
+
+        try:
+            await client.start(DISCORD_BOT_TOKEN)
+        except Exception:
+            logger.exception("Failed to start bot")
+        finally:
+            TaskScheduler.stop_all()
+            await UsageDAO.get_instance().flush()
+            await ConnectionDAO().flush_history()
     finally:
-        TaskScheduler.stop_all()
+        await ConnectionPool.get_instance().close()
         logger.info("Bot stopped")
 
 
@@ -1,5 +1,9 @@
+import asyncio
+
 from discord import Client, Intents, app_commands
 
+from src.aibot.infrastructure.api.factory import ResponseFactory
+
 intents = Intents.default()
 intents.message_content = True
 intents.members = True
@@ -8,19 +12,17 @@ intents.members = True
 class BotClient(Client):
     """A singleton class for the bot client."""
 
-    _instance: "BotClient"
     tree: app_commands.CommandTree
 
     def __init__(self) -> None:
         super().__init__(intents=intents)
         self.tree = app_commands.CommandTree(self)
+        self._warm_up_task: asyncio.Task[None] | None = None
 
     @classmethod
     def get_instance(cls) -> "BotClient":
         """Get the singleton instance of the bot client."""
-        if not hasattr(cls, "_instance"):
-            cls._instance = cls()
-        return cls._instance
+        return _BOT
 
     async def setup_hook(self) -> None:
         """Set up the bot.
@@ -28,8 +30,15 @@ class BotClient(Client):
         This function called once during bot initialization after login
         but before WebSocket connection.
         """
+        # Open provider connections in the background while commands sync
+        self._warm_up_task = asyncio.create_task(ResponseFactory.get_instance().warm_up())
+
         # Syncs the application commands to Discord
         await self.tree.sync()
 
     async def on_ready(self) -> None:
         """Event handler called when the bot is ready."""
+
+
+# The singleton instance, created once at import time
+_BOT = BotClient()
@@ -7,12 +7,12 @@ from src.aibot.infrastructure.dao.usage import UsageDAO
 from src.aibot.logger import logger
 from src.aibot.models.chat import ChatMessage
 from src.aibot.services.instruction import InstructionService
-from src.aibot.services.provider import ProviderManager
+from src.aibot.services.model_resolver import ModelResolver
 
-api_factory = ResponseFactory()
-client = BotClient().get_instance()
+api_factory = ResponseFactory.get_instance()
+client = BotClient.get_instance()
 instruction_service = InstructionService.get_instance()
-provider_manager = ProviderManager.get_instance()
+resolver = ModelResolver.get_instance()
 
 
 @client.tree.command(name="chat", description="AIとシングルターンのチャットを行います")
@@ -38,10 +38,6 @@ async def chat_command(interaction: Interaction, user_msg: str) -> None:
 
         message = ChatMessage(role="user", content=user_msg)
 
-        # Track usage
-        usage_dao = UsageDAO()
-        await usage_dao.increment_usage_count(user.id)
-
         # Get static instruction only (no custom instructions for chat command)
         system_instruction = instruction_service.load_static_instruction("chat")
         if system_instruction is None:
@@ -52,16 +48,19 @@ async def chat_command(interaction: Interaction, user_msg: str) -> None:
             )
             return
 
-        # Get current provider and generate response
-        current_provider = provider_manager.get_provider()
-        logger.debug("Using AI provider: %s for chat", current_provider)
+        # Resolve model for the current provider and generate response
+        model_config = resolver.resolve_model_for_command("chat")
+        logger.debug("Using AI model: %s for chat", model_config.id)
 
         response = await api_factory.generate_llm_response(
-            system=system_instruction,
-            messages=[message],
+            messages=message,
+            instruction=system_instruction,
+            model_config=model_config,
         )
 
         await interaction.followup.send(f"{response.content}")
+        # Track usage
+        UsageDAO.get_instance().record_async(user.id)
     except Exception as err:
         msg = f"Error in chat command: {err!s}"
         logger.exception(msg)
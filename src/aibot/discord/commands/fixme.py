@@ -1,18 +1,34 @@
+import asyncio
+import contextlib
+
 from discord import (
+    HTTPException,
     Interaction,
     TextStyle,
+    WebhookMessage,
+    app_commands,
 )
 from discord.ui import Modal, TextInput
 
 from src.aibot.discord.client import BotClient
-from src.aibot.infrastructure.api.factory import ResponseFactory
+from src.aibot.infrastructure.api.factory import PROVIDER_ERRORS, ResponseFactory
 from src.aibot.infrastructure.dao.usage import UsageDAO
+from src.aibot.logger import logger
 from src.aibot.models.chat import ChatMessage
 from src.aibot.services.instruction import InstructionService
-from src.aibot.services.model_resolver import ModelResolver
+from src.aibot.services.model_resolver import ModelResolver, get_model_choices
 
 client = BotClient.get_instance()
 
+# Interaction tokens expire after 15 minutes, so give up before followups fail
+RESPONSE_TIMEOUT_SECONDS = 14 * 60
+
+# Minimum interval between edits of a streaming message, to stay within rate limits
+STREAM_EDIT_INTERVAL_SECONDS = 1.0
+
+# Maximum number of characters Discord accepts in a single message
+MESSAGE_MAX_LENGTH = 2000
+
 
 class CodeModal(Modal):
     """Modal for entering code to fix."""
@@ -24,6 +40,10 @@ class CodeModal(Modal):
 
         self.selected_model = selected_model
 
+        # The public message the response is streamed into, and the text it shows
+        self._reply: WebhookMessage | None = None
+        self._reply_content = ""
+
         self.code_input = TextInput(
             label="コード",
             style=TextStyle.long,
@@ -41,9 +61,10 @@ class CodeModal(Modal):
             The interaction instance.
 
         """
-        try:
-            await interaction.response.defer(thinking=True)
+        # Acknowledge first so slow work never breaches Discord's response deadline
+        await interaction.response.defer(thinking=True)
 
+        try:
             code = self.code_input.value
             if not code.strip():
                 await interaction.followup.send(
@@ -53,7 +74,13 @@ class CodeModal(Modal):
                 return
 
             instruction_service = InstructionService.get_instance()
-            instruction = instruction_service.get_instruction("fixme")
+            instruction = instruction_service.load_static_instruction("fixme")
+            if instruction is None:
+                await interaction.followup.send(
+                    "**ERROR** - システム指示が設定されていません",
+                    ephemeral=True,
+                )
+                return
 
             message = ChatMessage(role="user", content=code)
 
@@ -62,40 +89,126 @@ class CodeModal(Modal):
             factory = ResponseFactory.get_instance()
             model_config = resolver.resolve_model_for_command("fixme", self.selected_model)
 
-            response = await factory.generate_llm_response(
-                messages=message,
-                instruction=instruction,
-                model_config=model_config,
-            )
+            self._reply = await interaction.followup.send("⏳", ephemeral=False, wait=True)
+
+            # Show the response as it is generated, editing at most once per interval
+            # and continuing in a new message once the current one is full
+            loop = asyncio.get_running_loop()
+            content = ""
+            last_edit = loop.time()
+            async with (
+                asyncio.timeout(RESPONSE_TIMEOUT_SECONDS),
+                contextlib.aclosing(
+                    factory.generate_llm_response_stream(
+                        messages=message,
+                        instruction=instruction,
+                        model_config=model_config,
+                    ),
+                ) as stream,
+            ):
+                async for delta in stream:
+                    content += delta
+                    while len(content) > MESSAGE_MAX_LENGTH:
+                        await self._edit_reply(content[:MESSAGE_MAX_LENGTH])
+                        content = content[MESSAGE_MAX_LENGTH:]
+                        self._reply = await interaction.followup.send(
+                            "⏳",
+                            ephemeral=False,
+                            wait=True,
+                        )
+                        self._reply_content = ""
+                        last_edit = loop.time()
+                    if loop.time() - last_edit >= STREAM_EDIT_INTERVAL_SECONDS:
+                        await self._edit_reply(content)
+                        last_edit = loop.time()
+
+            # Content is only empty if the model returned nothing at all
+            if not content:
+                await self._show_error_in_reply("**ERROR** - レスポンスが空でした")
+                return
 
-            await interaction.followup.send(
-                response.content,
-                ephemeral=False,
-            )
+            await self._edit_reply(content)
             # Track usage
-            await UsageDAO().increment_usage_count(interaction.user.id)
-        except Exception as e:
-            await interaction.followup.send(
-                f"**ERROR** - レスポンスの生成に失敗しました: {e!s}",
-                ephemeral=True,
-            )
+            UsageDAO.get_instance().record_async(interaction.user.id)
+        except PROVIDER_ERRORS as e:
+            error_message = f"**ERROR** - レスポンスの生成に失敗しました: {e!s}"
+            if self._reply is None:
+                await interaction.followup.send(error_message, ephemeral=True)
+            else:
+                await self._show_error_in_reply(error_message)
+
+    async def _edit_reply(self, content: str) -> None:
+        """Show content in the reply message.
+
+        Parameters
+        ----------
+        content : str
+            The content to show.
+
+        """
+        if self._reply is not None:
+            await self._reply.edit(content=content)
+            self._reply_content = content
+
+    async def _show_error_in_reply(self, error_message: str) -> None:
+        """Show an error in the reply message after any partial response.
+
+        Parameters
+        ----------
+        error_message : str
+            The error message to show.
+
+        """
+        marker = f"\n\n{error_message}" if self._reply_content else error_message
+        await self._edit_reply(self._reply_content[: MESSAGE_MAX_LENGTH - len(marker)] + marker)
+
+    # Modal narrows View.on_error by dropping the item argument, so this matches
+    # Modal's signature but not View's
+    async def on_error(self, interaction: Interaction, error: Exception, /) -> None:  # type: ignore[override]
+        """Handle an unexpected error raised while handling the submission.
+
+        Parameters
+        ----------
+        interaction : Interaction
+            The interaction instance.
+        error : Exception
+            The exception that was raised.
+
+        """
+        logger.exception("Unexpected error in /fixme", exc_info=error)
+
+        error_message = "**ERROR** - `/fixme`コマンドの実行中にエラーが発生しました"
+        if self._reply is not None:
+            # Fall back to a separate message if the reply cannot be edited
+            with contextlib.suppress(HTTPException):
+                await self._show_error_in_reply(error_message)
+                return
+
+        if interaction.response.is_done():
+            await interaction.followup.send(error_message, ephemeral=True)
+        else:
+            await interaction.response.send_message(error_message, ephemeral=True)
 
 
 @client.tree.command(name="fixme", description="コードのバグを特定し修正します")
-async def fixme_command(interaction: Interaction) -> None:
+@app_commands.choices(model=get_model_choices("fixme"))
+async def fixme_command(interaction: Interaction, model: str | None = None) -> None:
     """Detect and fix bugs in code.
 
     Parameters
     ----------
     interaction : Interaction
         The interaction instance.
+    model : str | None
+        The ID of the model to use. If None, the model is resolved from
+        the command configuration and the current provider.
 
     """
     try:
-        modal = CodeModal(selected_model=None)
+        modal = CodeModal(selected_model=model)
         await interaction.response.send_modal(modal)
 
-    except Exception as e:
+    except HTTPException as e:
         await interaction.response.send_message(
             f"**ERROR** - `/fixme`コマンドの実行中にエラーが発生しました: {e!s}",
             ephemeral=True,
@@ -9,7 +9,7 @@ from src.aibot.logger import logger
 from src.aibot.services.instruction import InstructionService
 from src.aibot.services.restriction import RestrictionService
 
-client = BotClient().get_instance()
+client = BotClient.get_instance()
 instruction_service = InstructionService.get_instance()
 restriction_service = RestrictionService.get_instance()
 
@@ -4,9 +4,9 @@ from discord.ui import Select, View
 from src.aibot.discord.client import BotClient
 from src.aibot.discord.decorators.permission import is_admin_user
 from src.aibot.logger import logger
-from src.aibot.services.provider import ProviderManager, ProviderType
+from src.aibot.services.provider import ProviderManager
 
-client = BotClient().get_instance()
+client = BotClient.get_instance()
 provider_manager = ProviderManager.get_instance()
 
 
@@ -57,7 +57,7 @@ class ProviderSelector(Select):
             # Defer the response first
             await interaction.response.defer(ephemeral=True)
 
-            chosen_provider: ProviderType = self.values[0]
+            chosen_provider = self.values[0]
 
             # Update the global provider setting
             provider_manager.set_provider(chosen_provider)
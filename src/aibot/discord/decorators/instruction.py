@@ -22,10 +22,9 @@ def is_restricted() -> Callable[[T], T]:
         A decorator that checks whether restriction mode is active.
 
     """
+    restriction_service = RestrictionService.get_instance()
 
     async def predicate(interaction: Interaction) -> bool:
-        restriction_service = RestrictionService.get_instance()
-
         if restriction_service.is_restricted():
             error_message = "⚠️ 制限モードが有効です。カスタム指示の作成・変更ができません。"
             await interaction.response.send_message(error_message, ephemeral=True)
@@ -1,15 +1,18 @@
+from collections.abc import AsyncGenerator
+
 import anthropic
 from anthropic.types import Message as AnthropicMessage
 
-from src.aibot.models.chat import ChatHistory, ChatMessage
-
+from ._http import shared_transport
 from ._params import ClaudeParams
 
-client = anthropic.Anthropic()
+client = anthropic.AsyncAnthropic(
+    http_client=anthropic.DefaultAsyncHttpxClient(transport=shared_transport),
+)
 
 
 async def generate_anthropic_response(
-    messages: ChatMessage | list[ChatMessage],
+    convo: list[dict[str, str]],
     instruction: str,
     params: ClaudeParams,
 ) -> AnthropicMessage:
@@ -17,8 +20,8 @@ async def generate_anthropic_response(
 
     Parameters
     ----------
-    messages : ChatMessage | list[ChatMessage]
-        The user's message (and message history).
+    convo : list[dict[str, str]]
+        The rendered conversation, ending with the empty assistant turn.
     instruction : str
         The system instruction.
     params : ClaudeParams
@@ -30,8 +33,7 @@ async def generate_anthropic_response(
         The response from the Anthropic API.
 
     """
-    convo = ChatHistory(chat_msgs=[*messages, ChatMessage(role="assistant")]).render_messages()
-    response = client.messages.create(
+    response = await client.messages.create(
         model=params.model,
         messages=convo,
         max_tokens=params.max_tokens,
@@ -41,3 +43,37 @@ async def generate_anthropic_response(
     )
 
     return response  # noqa: RET504
+
+
+async def stream_anthropic_response(
+    convo: list[dict[str, str]],
+    instruction: str,
+    params: ClaudeParams,
+) -> AsyncGenerator[str, None]:
+    """Stream a response from Anthropic API.
+
+    Parameters
+    ----------
+    convo : list[dict[str, str]]
+        The rendered conversation, ending with the empty assistant turn.
+    instruction : str
+        The system instruction.
+    params : ClaudeParams
+        The parameters controlling the response.
+
+    Yields
+    ------
+    str
+        Text deltas of the response as they are generated.
+
+    """
+    async with client.messages.stream(
+        model=params.model,
+        messages=convo,
+        max_tokens=params.max_tokens,
+        system=instruction,
+        temperature=params.temperature,
+        top_p=params.top_p,
+    ) as stream:
+        async for text in stream.text_stream:
+            yield text
@@ -1,16 +1,54 @@
+import contextlib
+import functools
+from collections.abc import AsyncGenerator
+
 from google import genai
 from google.genai import types
 from google.genai.types import GenerateContentResponse
 
-from src.aibot.models.chat import ChatHistory, ChatMessage
-
+from ._http import shared_transport
 from ._params import GeminiParams
 
-_client = genai.Client()
+# Passing a transport makes the SDK use its pooled httpx client instead of
+# opening a new aiohttp session for every request
+_client = genai.Client(
+    http_options=types.HttpOptions(async_client_args={"transport": shared_transport}),
+)
+
+
+@functools.lru_cache(maxsize=128)
+def _gemini_config(
+    instruction: str,
+    temperature: float,
+    top_p: float,
+) -> types.GenerateContentConfig:
+    """Build the generation config, reusing it for identical settings.
+
+    Parameters
+    ----------
+    instruction : str
+        The system instruction.
+    temperature : float
+        The temperature parameter.
+    top_p : float
+        The top_p parameter.
+
+    Returns
+    -------
+    types.GenerateContentConfig
+        The generation config.
+
+    """
+    return types.GenerateContentConfig(
+        system_instruction=instruction,
+        temperature=temperature,
+        top_p=top_p,
+        thinking_config=types.ThinkingConfig(thinking_budget=0),
+    )
 
 
 async def generate_gemini_response(
-    messages: list[ChatMessage],
+    convo: list[dict[str, str]],
     instruction: str,
     params: GeminiParams,
 ) -> GenerateContentResponse:
@@ -18,8 +56,8 @@ async def generate_gemini_response(
 
     Parameters
     ----------
-    messages : list[ChatMessage]
-        The user's message (and message history).
+    convo : list[dict[str, str]]
+        The rendered conversation, ending with the empty assistant turn.
     instruction : str
         The system instruction.
     params : GeminiParams
@@ -31,17 +69,47 @@ async def generate_gemini_response(
         The response from the Gemini API.
 
     """
-    convo = ChatHistory(chat_msgs=[*messages, ChatMessage(role="assistant")]).render_messages()
-    contents = "\n".join([msg["content"] for msg in convo if msg["content"]])
-    response = _client.models.generate_content(
+    contents = "\n".join(msg["content"] for msg in convo if msg["content"])
+    response = await _client.aio.models.generate_content(
         model=params.model,
-        config=types.GenerateContentConfig(
-            system_instruction=instruction,
-            temperature=params.temperature,
-            top_p=params.top_p,
-            thinking_config=types.ThinkingConfig(thinking_budget=0),
-        ),
+        config=_gemini_config(instruction, params.temperature, params.top_p),
         contents=contents,
     )
 
     return response  # noqa: RET504
+
+
+async def stream_gemini_response(
+    convo: list[dict[str, str]],
+    instruction: str,
+    params: GeminiParams,
+) -> AsyncGenerator[str, None]:
+    """Stream a response from Gemini API.
+
+    Parameters
+    ----------
+    convo : list[dict[str, str]]
+        The rendered conversation, ending with the empty assistant turn.
+    instruction : str
+        The system instruction.
+    params : GeminiParams
+        The parameters controlling the response.
+
+    Yields
+    ------
+    str
+        Text deltas of the response as they are generated.
+
+    """
+    contents = "\n".join(msg["content"] for msg in convo if msg["content"])
+    stream = await _client.aio.models.generate_content_stream(
+        model=params.model,
+        config=_gemini_config(instruction, params.temperature, params.top_p),
+        contents=contents,
+    )
+    # Release the HTTP response even if the consumer stops early. The SDK returns an
+    # async generator but annotates it as AsyncIterator, which has no aclose().
+    async with contextlib.aclosing(stream):  # type: ignore[type-var]
+        async for chunk in stream:
+            if chunk.text:
+                yield chunk.text
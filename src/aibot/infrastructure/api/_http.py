@@ -0,0 +1,73 @@
+import asyncio
+import socket
+
+import httpx
+
+from src.aibot.logger import logger
+
+# Seconds an idle keep-alive connection stays open (httpx defaults to 5)
+KEEPALIVE_EXPIRY_SECONDS = 120.0
+
+
+def _keepalive_socket_options() -> list[tuple[int, int, int]]:
+    """Build TCP keepalive socket options.
+
+    These match what the provider SDKs set on a transport they create
+    themselves, which they skip when given a transport.
+
+    Returns
+    -------
+    list[tuple[int, int, int]]
+        Socket options as (level, option, value).
+
+    """
+    options = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+    # Not every platform provides every option
+    for name, value in (
+        ("TCP_KEEPIDLE", 60),
+        ("TCP_KEEPALIVE", 60),
+        ("TCP_KEEPINTVL", 60),
+        ("TCP_KEEPCNT", 5),
+    ):
+        option = getattr(socket, name, None)
+        if option is not None:
+            options.append((socket.IPPROTO_TCP, option, value))
+    return options
+
+
+# Connection pool shared by all provider clients, so keep-alive connections
+# opened by one request are reused by the next
+shared_transport = httpx.AsyncHTTPTransport(
+    limits=httpx.Limits(
+        max_connections=100,
+        max_keepalive_connections=64,
+        keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS,
+    ),
+    socket_options=_keepalive_socket_options(),
+)
+
+# Provider API endpoints to connect to before the first request
+PROVIDER_URLS = (
+    "https://api.anthropic.com",
+    "https://api.openai.com",
+    "https://generativelanguage.googleapis.com",
+)
+
+# Client for warm-up requests. It is never closed, since that would also close
+# the shared transport used by the provider clients
+_warm_up_client = httpx.AsyncClient(transport=shared_transport, timeout=10.0)
+
+
+async def warm_up_connections() -> None:
+    """Open keep-alive connections to every provider API.
+
+    This pays the TCP and TLS handshakes up front, so the first request
+    after startup reuses an established connection.
+    """
+    results = await asyncio.gather(
+        *(_warm_up_client.head(url) for url in PROVIDER_URLS),
+        return_exceptions=True,
+    )
+    for url, result in zip(PROVIDER_URLS, results, strict=True):
+        if isinstance(result, Exception):
+            logger.warning("Failed to warm up connection to %s: %s", url, result)
@@ -1,16 +1,18 @@
-from openai import OpenAI
-from openai.types.chat import ChatCompletion
-from openai.types.moderation_create_response import ModerationCreateResponse
+from collections.abc import AsyncGenerator
+from typing import cast
 
-from src.aibot.models.chat import ChatHistory, ChatMessage
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+from openai.types.chat import ChatCompletion, ChatCompletionMessageParam
+from openai.types.moderation_create_response import ModerationCreateResponse
 
+from ._http import shared_transport
 from ._params import GPTParams
 
-_client = OpenAI()
+_client = AsyncOpenAI(http_client=DefaultAsyncHttpxClient(transport=shared_transport))
 
 
 async def generate_openai_response(
-    messages: list[ChatMessage],
+    convo: list[dict[str, str]],
     instruction: str,
     params: GPTParams,
 ) -> ChatCompletion:
@@ -18,8 +20,8 @@ async def generate_openai_response(
 
     Parameters
     ----------
-    messages : list[ChatMessage]
-        The user's message (and message history).
+    convo : list[dict[str, str]]
+        The rendered conversation, ending with the empty assistant turn.
     instruction : str
         The system instruction.
     params : GPTParams
@@ -31,9 +33,13 @@ async def generate_openai_response(
         The response from the OpenAI API.
 
     """
-    convo = ChatHistory(chat_msgs=[*messages, ChatMessage(role="assistant")]).render_messages()
-    full_prompt = [{"role": "developer", "content": instruction}, *convo]
-    response = _client.chat.completions.create(
+    # The rendered turns are plain role/content dicts, which is what the SDK's
+    # message params are at runtime
+    full_prompt = cast(
+        "list[ChatCompletionMessageParam]",
+        [{"role": "developer", "content": instruction}, *convo],
+    )
+    response = await _client.chat.completions.create(
         model=params.model,
         messages=full_prompt,
         max_tokens=params.max_tokens,
@@ -44,6 +50,49 @@ async def generate_openai_response(
     return response  # noqa: RET504
 
 
+async def stream_openai_response(
+    convo: list[dict[str, str]],
+    instruction: str,
+    params: GPTParams,
+) -> AsyncGenerator[str, None]:
+    """Stream a response from OpenAI API.
+
+    Parameters
+    ----------
+    convo : list[dict[str, str]]
+        The rendered conversation, ending with the empty assistant turn.
+    instruction : str
+        The system instruction.
+    params : GPTParams
+        The parameters controlling the response.
+
+    Yields
+    ------
+    str
+        Text deltas of the response as they are generated.
+
+    """
+    # The rendered turns are plain role/content dicts, which is what the SDK's
+    # message params are at runtime
+    full_prompt = cast(
+        "list[ChatCompletionMessageParam]",
+        [{"role": "developer", "content": instruction}, *convo],
+    )
+    stream = await _client.chat.completions.create(
+        model=params.model,
+        messages=full_prompt,
+        max_tokens=params.max_tokens,
+        temperature=params.temperature,
+        top_p=params.top_p,
+        stream=True,
+    )
+    # Release the HTTP response even if the consumer stops early
+    async with stream:
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+
 async def get_openai_moderation_result(content: str) -> ModerationCreateResponse:
     """Get detailed moderation results from OpenAI.
 
@@ -58,7 +107,7 @@ async def get_openai_moderation_result(content: str) -> ModerationCreateResponse
         Detailed moderation result including categories and scores
 
     """
-    moderation_response = _client.moderations.create(
+    moderation_response = await _client.moderations.create(
         model="omni-moderation-latest",
         input=content,
     )
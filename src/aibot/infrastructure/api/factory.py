@@ -1,46 +1,92 @@
+import asyncio
+import contextlib
 import os
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from typing import Any
 
+import anthropic
+import httpx
+import openai
 from anthropic.types import Message as AnthropicMessage
+from google.genai import errors as genai_errors
 from google.genai.types import GenerateContentResponse
 from openai.types.chat import ChatCompletion
 
+from src.aibot.infrastructure.cache.llm_cache import LLMCache
 from src.aibot.logger import logger
-from src.aibot.models.chat import ChatMessage
+from src.aibot.models.chat import ChatHistory, ChatMessage
 from src.aibot.services.model_resolver import ModelConfig
+from src.aibot.services.provider import ProviderType
 
-from ._anthropic import generate_anthropic_response
-from ._gemini import generate_gemini_response
-from ._openai import generate_openai_response
+from ._anthropic import generate_anthropic_response, stream_anthropic_response
+from ._gemini import generate_gemini_response, stream_gemini_response
+from ._http import warm_up_connections
+from ._openai import generate_openai_response, stream_openai_response
 from ._params import ClaudeParams, GeminiParams, GPTParams, ParamsUnion
 
 # Type alias for any LLM response
 LLMResponse = AnthropicMessage | GenerateContentResponse | ChatCompletion
 
+# Errors expected from a provider call, handled without a traceback
+PROVIDER_ERRORS = (
+    anthropic.APIError,
+    openai.APIError,
+    genai_errors.APIError,
+    httpx.HTTPError,
+    TimeoutError,
+)
+
+_cache = LLMCache()
+# Provider calls in progress, keyed by cache key, shared by identical concurrent requests
+_in_flight: dict[str, asyncio.Task[LLMResponse]] = {}
+
+# Parameters class for each provider name
+_PARAM_CLS: dict[ProviderType, type[ParamsUnion]] = {
+    ProviderType.ANTHROPIC: ClaudeParams,
+    ProviderType.GOOGLE: GeminiParams,
+    ProviderType.OPENAI: GPTParams,
+}
+# Provider call for each parameter type
+_DISPATCH: dict[type, Callable[..., Awaitable[LLMResponse]]] = {
+    ClaudeParams: generate_anthropic_response,
+    GeminiParams: generate_gemini_response,
+    GPTParams: generate_openai_response,
+}
+# Provider stream for each parameter type
+_STREAM_DISPATCH: dict[type, Callable[..., AsyncGenerator[str, None]]] = {
+    ClaudeParams: stream_anthropic_response,
+    GeminiParams: stream_gemini_response,
+    GPTParams: stream_openai_response,
+}
+# Content extraction for each response type
+_EXTRACT: dict[type, Callable[[Any], str | None]] = {
+    AnthropicMessage: lambda r: r.content[0].text,
+    GenerateContentResponse: lambda r: r.text,
+    ChatCompletion: lambda r: r.choices[0].message.content,
+}
+
 
 class ResponseFactory:
     """Singleton factory for creating chat messages from LLM responses.
 
     This factory is responsible for:
     1. Converting ModelConfig to provider-specific parameters
-    2. Calling appropriate LLM provider
-    3. Converting LLM response to ChatMessage
+    2. Returning a cached response for identical requests
+    3. Calling appropriate LLM provider, sharing one call among identical concurrent requests
+    4. Converting LLM response to ChatMessage
 
     """
 
-    _instance: "ResponseFactory | None" = None
-
-    def __new__(cls) -> "ResponseFactory":
-        """Create or return the singleton instance."""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+    __slots__ = ()
 
     @classmethod
     def get_instance(cls) -> "ResponseFactory":
         """Get the singleton instance."""
-        if cls._instance is None:
-            cls._instance = cls()
-        return cls._instance
+        return _FACTORY
+
+    async def warm_up(self) -> None:
+        """Open connections to the provider APIs ahead of the first request."""
+        await warm_up_connections()
 
     def _get_api_key(self, provider: str) -> str:
         """Get API key for the specified provider.
@@ -87,14 +133,8 @@ class ResponseFactory:
 
         """
         try:
-            content: str | None = None
-
-            if isinstance(response, AnthropicMessage):
-                content = response.content[0].text
-            elif isinstance(response, GenerateContentResponse):
-                content = response.text
-            elif isinstance(response, ChatCompletion):
-                content = response.choices[0].message.content
+            extract = _EXTRACT.get(type(response))
+            content = extract(response) if extract is not None else None
 
             if content is None:
                 msg = f"Failed to extract content from {type(response).__name__}"
@@ -102,9 +142,9 @@ class ResponseFactory:
 
             return ChatMessage(role="assistant", content=content)
 
-        except Exception as e:
+        except (AttributeError, IndexError) as e:
             msg = f"Failed to extract content from {type(response).__name__}: {e}"
-            logger.exception(msg)
+            logger.error(msg)
             raise ValueError(msg) from e
 
     def _create_provider_params(self, model_config: ModelConfig) -> ParamsUnion:
@@ -122,39 +162,212 @@ class ResponseFactory:
 
         Raises
         ------
-        ValueError
+        TypeError
             If provider is not supported.
 
         """
-        provider = model_config.provider
-        model_id = model_config.id
-        params = model_config.params
-
-        if provider == "anthropic":
-            return ClaudeParams(
-                model=model_id,
-                max_tokens=params["max_tokens"],
-                temperature=params["temperature"],
-                top_p=params["top_p"],
-            )
-        if provider == "google":
-            return GeminiParams(
-                model=model_id,
-                max_tokens=params["max_tokens"],
-                temperature=params["temperature"],
-                top_p=params["top_p"],
-            )
-        if provider == "openai":
-            return GPTParams(
-                model=model_id,
-                max_tokens=params["max_tokens"],
-                temperature=params["temperature"],
-                top_p=params["top_p"],
-            )
+        try:
+            params_cls = _PARAM_CLS[model_config.provider]
+        except KeyError:
+            msg = f"Unsupported provider: {model_config.provider}"
+            raise TypeError(msg) from None
+
+        return params_cls(model=model_config.id, **model_config.params)
+
+    def _cache_key(
+        self,
+        convo: list[dict[str, str]],
+        instruction: str,
+        model_config: ModelConfig,
+        provider_params: ParamsUnion,
+    ) -> str:
+        """Build the response cache key for a request.
+
+        Parameters
+        ----------
+        convo : list[dict[str, str]]
+            The rendered conversation.
+        instruction : str
+            System instruction for the LLM.
+        model_config : ModelConfig
+            Model configuration to use.
+        provider_params : ParamsUnion
+            Provider-specific parameters.
+
+        Returns
+        -------
+        str
+            The cache key.
+
+        """
+        return _cache.cache_key(
+            provider=str(model_config.provider),
+            model=model_config.id,
+            messages=convo,
+            instruction=instruction,
+            temperature=provider_params.temperature,
+            top_p=provider_params.top_p,
+        )
+
+    def _is_cacheable(self, provider_params: ParamsUnion) -> bool:
+        """Check whether responses for the parameters may be cached.
+
+        Only responses generated with temperature 0 are deterministic. Caching
+        a sampled response would hand a user who retries the same answer.
+
+        Parameters
+        ----------
+        provider_params : ParamsUnion
+            Provider-specific parameters.
+
+        Returns
+        -------
+        bool
+            True if the response may be cached, False otherwise.
+
+        """
+        return provider_params.temperature == 0
+
+    async def _call_provider(
+        self,
+        convo: list[dict[str, str]],
+        instruction: str,
+        provider_params: ParamsUnion,
+    ) -> LLMResponse:
+        """Call the LLM provider matching the parameters.
+
+        Parameters
+        ----------
+        convo : list[dict[str, str]]
+            The rendered conversation.
+        instruction : str
+            System instruction for the LLM.
+        provider_params : ParamsUnion
+            Provider-specific parameters.
+
+        Returns
+        -------
+        LLMResponse
+            The raw response from the provider.
+
+        Raises
+        ------
+        TypeError
+            If the parameters type is not supported.
+
+        """
+        provider_call = _DISPATCH.get(type(provider_params))
+        if provider_call is not None:
+            return await provider_call(convo, instruction, provider_params)
+
+        msg = f"Unsupported provider params type: {type(provider_params)}"
+        logger.error(msg)
+        raise TypeError(msg)
+
+    async def _call_provider_shared(
+        self,
+        cache_key: str,
+        convo: list[dict[str, str]],
+        instruction: str,
+        provider_params: ParamsUnion,
+    ) -> LLMResponse:
+        """Call the LLM provider, sharing the call with identical concurrent requests.
+
+        Parameters
+        ----------
+        cache_key : str
+            The cache key identifying the request.
+        convo : list[dict[str, str]]
+            The rendered conversation.
+        instruction : str
+            System instruction for the LLM.
+        provider_params : ParamsUnion
+            Provider-specific parameters.
+
+        Returns
+        -------
+        LLMResponse
+            The raw response from the provider.
+
+        """
+        task = _in_flight.get(cache_key)
+        if task is None:
+            task = asyncio.create_task(self._call_provider(convo, instruction, provider_params))
+            _in_flight[cache_key] = task
+            task.add_done_callback(lambda _: _in_flight.pop(cache_key, None))
 
-        msg = f"Unsupported provider: {provider}"
+        # Shielded so a cancelled caller does not cancel the call for the others
+        return await asyncio.shield(task)
+
+    def _stream_provider(
+        self,
+        convo: list[dict[str, str]],
+        instruction: str,
+        provider_params: ParamsUnion,
+    ) -> AsyncGenerator[str, None]:
+        """Stream from the LLM provider matching the parameters.
+
+        Parameters
+        ----------
+        convo : list[dict[str, str]]
+            The rendered conversation.
+        instruction : str
+            System instruction for the LLM.
+        provider_params : ParamsUnion
+            Provider-specific parameters.
+
+        Returns
+        -------
+        AsyncGenerator[str, None]
+            Text deltas of the response.
+
+        Raises
+        ------
+        TypeError
+            If the parameters type is not supported.
+
+        """
+        provider_stream = _STREAM_DISPATCH.get(type(provider_params))
+        if provider_stream is not None:
+            return provider_stream(convo, instruction, provider_params)
+
+        msg = f"Unsupported provider params type: {type(provider_params)}"
+        logger.error(msg)
         raise TypeError(msg)
 
+    def _prepare_request(
+        self,
+        messages: ChatMessage | list[ChatMessage],
+        instruction: str,
+        model_config: ModelConfig,
+    ) -> tuple[ParamsUnion, list[dict[str, str]], str, str | None]:
+        """Build everything a request needs and look it up in the cache.
+
+        Parameters
+        ----------
+        messages : ChatMessage | list[ChatMessage]
+            Input messages for the LLM.
+        instruction : str
+            System instruction for the LLM.
+        model_config : ModelConfig
+            Model configuration to use.
+
+        Returns
+        -------
+        tuple[ParamsUnion, list[dict[str, str]], str, str | None]
+            Provider-specific parameters, the rendered conversation, the cache
+            key, and the cached response content or None if there is none.
+
+        """
+        provider_params = self._create_provider_params(model_config)
+
+        msgs = messages if isinstance(messages, list) else [messages]
+        # Render once and share it between the cache key and the provider call
+        convo = ChatHistory(chat_msgs=[*msgs, ChatMessage(role="assistant")]).render_messages()
+        cache_key = self._cache_key(convo, instruction, model_config, provider_params)
+        cached_content = _cache.get(cache_key) if self._is_cacheable(provider_params) else None
+        return provider_params, convo, cache_key, cached_content
+
     async def generate_llm_response(
         self,
         messages: ChatMessage | list[ChatMessage],
@@ -183,26 +396,83 @@ class ResponseFactory:
             If provider is not supported or API call fails.
 
         """
-        provider_params = self._create_provider_params(model_config)
+        provider_params, convo, cache_key, cached_content = self._prepare_request(
+            messages,
+            instruction,
+            model_config,
+        )
+        if cached_content is not None:
+            logger.debug("Using cached response for model %s", model_config.id)
+            return ChatMessage(role="assistant", content=cached_content)
 
         try:
-            response: LLMResponse
-            if isinstance(provider_params, ClaudeParams):
-                response = await generate_anthropic_response(
-                    messages,
-                    instruction,
-                    provider_params,
-                )
-            elif isinstance(provider_params, GeminiParams):
-                response = await generate_gemini_response(messages, instruction, provider_params)
-            elif isinstance(provider_params, GPTParams):
-                response = await generate_openai_response(messages, instruction, provider_params)
-            else:
-                msg = f"Unsupported provider params type: {type(provider_params)}"
-                logger.error(msg)
-
-            return self._create_chat_message(response)
+            response = await self._call_provider_shared(
+                cache_key,
+                convo,
+                instruction,
+                provider_params,
+            )
+            chat_message = self._create_chat_message(response)
 
-        except Exception as e:
+        except PROVIDER_ERRORS as e:
             logger.error("Failed to generate LLM response with model %s: %s", model_config.id, e)
             raise
+
+        if chat_message.content is not None and self._is_cacheable(provider_params):
+            _cache.set(cache_key, chat_message.content)
+        return chat_message
+
+    async def generate_llm_response_stream(
+        self,
+        messages: ChatMessage | list[ChatMessage],
+        instruction: str,
+        model_config: ModelConfig,
+    ) -> AsyncGenerator[str, None]:
+        """Generate a response incrementally using the appropriate LLM provider.
+
+        A cached response is yielded as a single chunk.
+
+        Parameters
+        ----------
+        messages : ChatMessage | list[ChatMessage]
+            Input messages for the LLM.
+        instruction : str
+            System instruction for the LLM.
+        model_config : ModelConfig
+            Model configuration to use.
+
+        Yields
+        ------
+        str
+            Text deltas of the generated response.
+
+        """
+        provider_params, convo, cache_key, cached_content = self._prepare_request(
+            messages,
+            instruction,
+            model_config,
+        )
+        if cached_content is not None:
+            logger.debug("Using cached response for model %s", model_config.id)
+            yield cached_content
+            return
+
+        chunks: list[str] = []
+        try:
+            # Close the provider stream as well when the consumer stops early
+            async with contextlib.aclosing(
+                self._stream_provider(convo, instruction, provider_params),
+            ) as stream:
+                async for chunk in stream:
+                    chunks.append(chunk)
+                    yield chunk
+        except PROVIDER_ERRORS as e:
+            logger.error("Failed to stream LLM response with model %s: %s", model_config.id, e)
+            raise
+
+        if chunks and self._is_cacheable(provider_params):
+            _cache.set(cache_key, "".join(chunks))
+
+
+# The singleton instance, created once at import time
+_FACTORY = ResponseFactory()
@@ -0,0 +1,101 @@
+import hashlib
+import json
+from collections import OrderedDict
+
+# Maximum number of cached responses before the least recently used is evicted
+DEFAULT_MAXSIZE = 1024
+
+
+class LLMCache:
+    """In-process cache for LLM responses.
+
+    Responses are stored under a key derived from every input that affects
+    the generated output, so identical deterministic requests skip the
+    provider round-trip.
+    The cache holds at most `maxsize` entries and evicts the least recently
+    used one when full.
+
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE) -> None:
+        self._maxsize = maxsize
+        self._entries: OrderedDict[str, str] = OrderedDict()
+
+    @staticmethod
+    def cache_key(  # noqa: PLR0913
+        *,
+        provider: str,
+        model: str,
+        messages: list[dict[str, str]],
+        instruction: str,
+        temperature: float,
+        top_p: float,
+    ) -> str:
+        """Build the cache key for an LLM request.
+
+        Parameters
+        ----------
+        provider : str
+            The provider name (anthropic, google, openai).
+        model : str
+            The model ID.
+        messages : list[dict[str, str]]
+            The rendered conversation sent to the model.
+        instruction : str
+            The system instruction.
+        temperature : float
+            The temperature parameter.
+        top_p : float
+            The top_p parameter.
+
+        Returns
+        -------
+        str
+            SHA-256 hex digest identifying the request.
+
+        """
+        payload = {
+            "provider": provider,
+            "model": model,
+            "messages": messages,
+            "instruction": instruction,
+            "temperature": temperature,
+            "top_p": top_p,
+        }
+        serialized = json.dumps(payload, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(serialized.encode()).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """Get a cached response.
+
+        Parameters
+        ----------
+        key : str
+            The cache key.
+
+        Returns
+        -------
+        str | None
+            The cached response content, or None if missing.
+
+        """
+        content = self._entries.get(key)
+        if content is not None:
+            self._entries.move_to_end(key)
+        return content
+
+    def set(self, key: str, content: str) -> None:
+        """Store a response in the cache.
+
+        Parameters
+        ----------
+        key : str
+            The cache key.
+        content : str
+            The response content.
+
+        """
+        self._entries[key] = content
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
@@ -1,12 +1,46 @@
+import asyncio
+import contextlib
+import datetime
 import os
 import re
+import sqlite3
+from collections.abc import AsyncIterator
 from typing import TYPE_CHECKING
 
+import aiosqlite
 import pytz
 
+from src.aibot.logger import logger
+
 if TYPE_CHECKING:
     from pytz.tzinfo import BaseTzInfo
 
+# Maximum number of read-only connections of the connection pool, opened on demand.
+# WAL lets them read concurrently, while writes go through a single connection
+# since SQLite serializes writers anyway.
+READ_POOL_SIZE = 4
+# Number of prepared statements cached per connection (sqlite3 default is 128)
+STATEMENT_CACHE_SIZE = 256
+
+# Table names are interpolated into SQL, so only letters, numbers and underscores are allowed
+TABLE_NAME_PATTERN = re.compile(r"[A-Za-z0-9_]+")
+
+# Settings applied to every pooled connection of an on-disk database.
+# WAL lets readers run alongside a writer, and synchronous=NORMAL skips the
+# fsync on each commit, which is still safe against corruption in WAL mode.
+CONNECTION_PRAGMAS = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA cache_size=-20000;
+PRAGMA mmap_size=268435456;
+"""
+
+# Explicit adapters in the format sqlite3 has always stored dates in. The
+# built-in ones are deprecated since Python 3.12.
+sqlite3.register_adapter(datetime.datetime, lambda d: d.isoformat(" "))
+sqlite3.register_adapter(datetime.date, lambda d: d.isoformat())
+
 
 class DAOBase:
     """Base class for DAO classes."""
@@ -16,6 +50,24 @@ class DAOBase:
     tz: str = os.getenv("TIMEZONE", "Asia/Tokyo")
     TIMEZONE: "BaseTzInfo" = pytz.timezone(tz)
 
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        """Validate the table names of a DAO class when it is defined.
+
+        Every class attribute whose name ends with ``TABLE_NAME`` is checked,
+        so an invalid name fails at import time instead of at table creation.
+
+        Raises
+        ------
+        ValueError
+            If a table name contains invalid characters.
+
+        """
+        super().__init_subclass__(**kwargs)
+        table_names = [getattr(cls, attr) for attr in dir(cls) if attr.endswith("TABLE_NAME")]
+        if not all(cls.validate_table_name(name) for name in table_names):
+            msg = "INVALID TABLENAME: Only alphanumeric characters and underscores are allowed."
+            raise ValueError(msg)
+
     @staticmethod
     def validate_table_name(table_name: str) -> bool:
         """Validate the table name.
@@ -33,5 +85,159 @@ class DAOBase:
             True if the table name is valid, False otherwise.
 
         """
-        pattern = r"^[A-Za-z0-9_]+$"
-        return bool(re.match(pattern, table_name))
+        return TABLE_NAME_PATTERN.fullmatch(table_name) is not None
+
+
+class _PooledConnections:
+    """A fixed-size set of reusable connections to one database.
+
+    Connections are opened lazily up to `size` and reused across calls,
+    which saves opening a connection (and its worker thread) per query
+    and keeps SQLite's page cache warm.
+
+    """
+
+    def __init__(self, database: str, size: int, *, read_only: bool = False) -> None:
+        self._database = database
+        self._size = size
+        self._read_only = read_only
+        self._opened = 0
+        self._idle: asyncio.Queue[aiosqlite.Connection] = asyncio.Queue()
+
+    async def open(self) -> None:
+        """Open all connections up front."""
+        while self._opened < self._size:
+            self._opened += 1
+            try:
+                self._idle.put_nowait(await self._connect())
+            except Exception:
+                self._opened -= 1
+                raise
+
+    async def close(self) -> None:
+        """Close all idle connections."""
+        while not self._idle.empty():
+            conn = self._idle.get_nowait()
+            self._opened -= 1
+            try:
+                await conn.close()
+            except aiosqlite.Error as close_err:
+                logger.error("Failed to close connection: %s", close_err)
+
+    @contextlib.asynccontextmanager
+    async def connection(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow a connection, returning it when the block exits."""
+        conn = await self._acquire()
+        try:
+            yield conn
+        finally:
+            await self._release(conn)
+
+    async def _connect(self) -> aiosqlite.Connection:
+        """Open a new database connection."""
+        # Autocommit mode: transactions are opened explicitly by the DAO, never
+        # implicitly by the sqlite3 driver. Declared column types are not parsed
+        # either, so values come back as stored without running converters.
+        conn = await aiosqlite.connect(
+            self._database,
+            detect_types=0,
+            isolation_level=None,
+            cached_statements=STATEMENT_CACHE_SIZE,
+        )
+        # WAL and mmap do not apply to in-memory databases
+        if self._database != ":memory:":
+            await conn.executescript(CONNECTION_PRAGMAS)
+        if self._read_only:
+            await conn.execute("PRAGMA query_only=ON;")
+        return conn
+
+    async def _acquire(self) -> aiosqlite.Connection:
+        """Take an idle connection, opening a new one if the set is not full."""
+        if self._idle.empty() and self._opened < self._size:
+            self._opened += 1
+            try:
+                return await self._connect()
+            except Exception:
+                self._opened -= 1
+                raise
+        return await self._idle.get()
+
+    async def _release(self, conn: aiosqlite.Connection) -> None:
+        """Return a connection to the idle set, discarding it if it is unusable."""
+        try:
+            if conn.in_transaction:
+                await conn.rollback()
+        except aiosqlite.Error as rollback_err:
+            logger.error("Rollback failed, discarding connection: %s", rollback_err)
+            self._opened -= 1
+            with contextlib.suppress(aiosqlite.Error):
+                await conn.close()
+            return
+        self._idle.put_nowait(conn)
+
+
+class ConnectionPool:
+    """A singleton pool of database connections shared by DAO instances.
+
+    Reads are served by several read-only connections and writes by a
+    single writer connection. An in-memory database exists per connection,
+    so in that case reads also go through the writer.
+
+    """
+
+    def __init__(self, database: str, read_size: int = READ_POOL_SIZE) -> None:
+        self._writer = _PooledConnections(database, 1)
+        self._readers = (
+            self._writer
+            if database == ":memory:"
+            else _PooledConnections(database, read_size, read_only=True)
+        )
+
+    @classmethod
+    def get_instance(cls) -> "ConnectionPool":
+        """Get the singleton instance."""
+        return _POOL
+
+    async def open(self) -> None:
+        """Open the writer connection up front.
+
+        Readers are opened on demand, since the connection status is served
+        from an in-process mirror and rarely read from the database.
+
+        """
+        # The writer goes first so it switches the database to WAL
+        await self._writer.open()
+
+    async def close(self) -> None:
+        """Close all idle connections of the pool."""
+        await self._readers.close()
+        await self._writer.close()
+
+    def read(self) -> contextlib.AbstractAsyncContextManager[aiosqlite.Connection]:
+        """Borrow a read-only connection.
+
+        Returns
+        -------
+        contextlib.AbstractAsyncContextManager[aiosqlite.Connection]
+            Context manager yielding the connection.
+
+        """
+        return self._readers.connection()
+
+    def write(self) -> contextlib.AbstractAsyncContextManager[aiosqlite.Connection]:
+        """Borrow the writer connection.
+
+        A transaction left open by the borrower is rolled back before the
+        connection is returned to the pool.
+
+        Returns
+        -------
+        contextlib.AbstractAsyncContextManager[aiosqlite.Connection]
+            Context manager yielding the connection.
+
+        """
+        return self._writer.connection()
+
+
+# The singleton instance, created once at import time
+_POOL = ConnectionPool(DAOBase.DB_NAME)
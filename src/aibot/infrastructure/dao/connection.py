@@ -1,16 +1,53 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import datetime
-from typing import TypedDict
+from typing import TYPE_CHECKING, ClassVar, TypedDict
 
 import aiosqlite
 
 from src.aibot.logger import logger
 
-from .base import DAOBase
+from .base import ConnectionPool, DAOBase
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
 
 # Types
 DatetimeLike = str | datetime.datetime
+# A queued history event: channel_id, guild_id, action, timestamp and error_message
+HistoryRow = tuple[str, str | None, str, str, str | None]
+
+# History rows are written in batches of up to this many rows...
+HISTORY_BATCH_SIZE = 64
+# ...or whatever has been queued within this many seconds of the first row
+HISTORY_FLUSH_INTERVAL = 0.1
+
+# Statements are kept as module constants so each call passes the same text,
+# letting sqlite3 reuse the prepared statement from its per-connection cache
+UPSERT_STATUS_QUERY = """
+INSERT OR REPLACE INTO connection_status
+(id, channel_id, guild_id, connected_at, last_updated)
+VALUES (1, ?, ?, ?, ?)
+RETURNING channel_id, guild_id, connected_at, last_updated;
+"""
+DELETE_STATUS_QUERY = """
+DELETE FROM connection_status
+WHERE id = 1
+RETURNING channel_id, guild_id, connected_at, last_updated;
+"""
+SELECT_STATUS_QUERY = """
+SELECT channel_id, guild_id, connected_at, last_updated
+FROM connection_status
+WHERE id = 1
+LIMIT 1;
+"""
+INSERT_HISTORY_QUERY = """
+INSERT INTO connection_history
+(channel_id, guild_id, action, timestamp, error_message)
+VALUES (?, ?, ?, ?, ?);
+"""
 
 
 class ConnectionInfo(TypedDict):
@@ -40,94 +77,63 @@ class ConnectionDAO(DAOBase):
     STATUS_TABLE_NAME: str = "connection_status"
     HISTORY_TABLE_NAME: str = "connection_history"
 
-    async def create_status_table(self) -> None:
-        """Create connection status table if it doesn't exist.
-
-        This table maintains the current connection state (single record).
-
-        Raises
-        ------
-        ValueError
-            If the table name contains invalid characters.
-
-        """
-        if not self.validate_table_name(self.STATUS_TABLE_NAME):
-            msg = "INVALID TABLENAME: Only alphanumeric characters and underscores are allowed."
-            raise ValueError(msg)
-
-        conn = await aiosqlite.connect(super().DB_NAME)
-        try:
-            query = f"""
-            CREATE TABLE IF NOT EXISTS {self.STATUS_TABLE_NAME} (
-                id            INTEGER PRIMARY KEY CHECK (id = 1),
-                channel_id    TEXT NOT NULL,
-                guild_id      TEXT,
-                connected_at  DATETIME NOT NULL,
-                last_updated  DATETIME NOT NULL
-            );
-            """
-            await conn.execute(query)
-            await conn.commit()
-        except Exception:
-            logger.exception("Failed to create status table")
-            raise
-        finally:
-            try:
-                await conn.close()
-            except Exception as close_err:
-                logger.error(f"Failed to close connection: {close_err}")
+    # In-process mirror of the status row. The bot is the only writer of the
+    # table, so once loaded the mirror answers reads without touching the database.
+    _current: ClassVar[ConnectionInfo | None] = None
+    _loaded: ClassVar[bool] = False
+    _lock: ClassVar[asyncio.Lock] = asyncio.Lock()
 
-    async def create_history_table(self) -> None:
-        """Create connection history table if it doesn't exist.
+    # History is for analytics and debugging only, so it is queued and written
+    # by a background task instead of inside the status transaction
+    _pending_history: ClassVar[asyncio.Queue[HistoryRow]] = asyncio.Queue()
+    _history_writer: ClassVar[asyncio.Task[None] | None] = None
 
-        This table logs all connection events for analytics and debugging.
+    async def create_tables(self) -> None:
+        """Create both status and history tables if they don't exist.
 
-        Raises
-        ------
-        ValueError
-            If the table name contains invalid characters.
+        The status table maintains the current connection state (single record),
+        and the history table logs all connection events for analytics and
+        debugging. The in-process mirror of the current connection is loaded
+        afterwards.
 
         """
-        if not self.validate_table_name(self.HISTORY_TABLE_NAME):
-            msg = "INVALID TABLENAME: Only alphanumeric characters and underscores are allowed."
-            raise ValueError(msg)
-
-        conn = await aiosqlite.connect(super().DB_NAME)
-        try:
-            query = f"""
-            CREATE TABLE IF NOT EXISTS {self.HISTORY_TABLE_NAME} (
-                id             INTEGER PRIMARY KEY AUTOINCREMENT,
-                channel_id     TEXT NOT NULL,
-                guild_id       TEXT,
-                action         TEXT NOT NULL CHECK
-                    (action IN ('CONNECT', 'DISCONNECT', 'ERROR')),
-                timestamp      DATETIME NOT NULL,
-                error_message  TEXT
-            );
-            """
-            await conn.execute(query)
-            await conn.commit()
-        except Exception:
-            logger.exception("Failed to create history table")
-            raise
-        finally:
+        async with ConnectionPool.get_instance().write() as conn:
             try:
-                await conn.close()
-            except Exception as close_err:
-                logger.error(f"Failed to close connection: {close_err}")
+                script = f"""
+                CREATE TABLE IF NOT EXISTS {self.STATUS_TABLE_NAME} (
+                    id            INTEGER PRIMARY KEY CHECK (id = 1),
+                    channel_id    TEXT NOT NULL,
+                    guild_id      TEXT,
+                    connected_at  DATETIME NOT NULL,
+                    last_updated  DATETIME NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS {self.HISTORY_TABLE_NAME} (
+                    id             INTEGER PRIMARY KEY AUTOINCREMENT,
+                    channel_id     TEXT NOT NULL,
+                    guild_id       TEXT,
+                    action         TEXT NOT NULL CHECK
+                        (action IN ('CONNECT', 'DISCONNECT', 'ERROR')),
+                    timestamp      DATETIME NOT NULL,
+                    error_message  TEXT
+                );
+                -- Index for looking up the history of a channel over time
+                CREATE INDEX IF NOT EXISTS idx_history_channel_ts
+                ON {self.HISTORY_TABLE_NAME} (channel_id, timestamp);
+                """
+                await conn.executescript(script)
+            except Exception:
+                logger.exception("Failed to create connection tables")
+                raise
 
-    async def create_tables(self) -> None:
-        """Create both status and history tables if they don't exist."""
-        await self.create_status_table()
-        await self.create_history_table()
+        await self._load_current_connection()
 
     async def connect(self, channel_id: str, guild_id: str | None = None) -> None:
         """Update connection status to connected state.
 
         This method safely handles connection by:
-        1. Logging any existing connection as disconnected
-        2. Setting new connection status
-        3. Recording the connection event in history
+        1. Setting new connection status
+        2. Queueing any existing connection as disconnected in history
+        3. Queueing the connection event in history
 
         Parameters
         ----------
@@ -137,52 +143,56 @@ class ConnectionDAO(DAOBase):
             The ID of the guild (server) containing the channel.
 
         """
-        conn = await aiosqlite.connect(super().DB_NAME)
-        now = datetime.datetime.now(super().TIMEZONE)
-
-        try:
-            # Use transaction to ensure data consistency
-            await conn.execute("BEGIN TRANSACTION;")
-
-            # Log existing connection as disconnected if exists
-            await self._log_disconnect_if_exists(conn, now)
+        # Format the timestamp once instead of adapting it on every bind
+        now = datetime.datetime.now(super().TIMEZONE).isoformat(" ")
+        # The mirror tells which connection is being replaced
+        if not self._loaded:
+            await self._load_current_connection()
+        async with self._lock, ConnectionPool.get_instance().write() as conn:
+            try:
+                previous = ConnectionDAO._current
 
-            # Set new connection status (INSERT or REPLACE)
-            status_query = """
-            INSERT OR REPLACE INTO connection_status
-            (id, channel_id, guild_id, connected_at, last_updated)
-            VALUES (1, ?, ?, ?, ?);
-            """
-            await conn.execute(status_query, (channel_id, guild_id, now, now))
+                # Take the write lock up front so the transaction never has to
+                # upgrade from a read lock mid-way
+                await conn.execute("BEGIN IMMEDIATE;")
 
-            # Log connection event in history
-            await self._log_history(conn, channel_id, guild_id, "CONNECT", now)
+                # Set new connection status (INSERT or REPLACE), returning the stored row
+                rows = await conn.execute_fetchall(
+                    UPSERT_STATUS_QUERY,
+                    (channel_id, guild_id, now, now),
+                )
 
-            await conn.commit()
-        except Exception as e:
-            try:
-                await conn.rollback()
-            except Exception as rollback_err:
-                logger.error(f"Rollback failed: {rollback_err}")
-            try:
-                await self._log_history(
-                    conn,
+                await conn.execute("COMMIT;")
+
+                ConnectionDAO._current = self._to_connection_info(rows)
+                ConnectionDAO._loaded = True
+
+                # Log existing connection (if any) as disconnected and the new
+                # connection event in history
+                if previous:
+                    self._log_history(
+                        previous["channel_id"],
+                        previous["guild_id"],
+                        "DISCONNECT",
+                        now,
+                        "Disconnected due to new connection",
+                    )
+                self._log_history(channel_id, guild_id, "CONNECT", now)
+            except Exception as e:
+                try:
+                    if conn.in_transaction:
+                        await conn.execute("ROLLBACK;")
+                except Exception as rollback_err:
+                    logger.error(f"Rollback failed: {rollback_err}")
+                self._log_history(
                     channel_id,
                     guild_id,
                     "ERROR",
                     now,
                     f"Connection failed: {type(e).__name__}: {e}",
                 )
-                await conn.commit()
-            except Exception as log_err:
-                logger.error(f"Failed to log error: {log_err}")
-            logger.exception("connect() failed")
-            raise
-        finally:
-            try:
-                await conn.close()
-            except Exception as close_err:
-                logger.error(f"Failed to close connection: {close_err}")
+                logger.exception("connect() failed")
+                raise
 
     async def disconnect(self) -> ConnectionInfo | None:
         """Disconnect from current voice channel.
@@ -196,66 +206,55 @@ class ConnectionDAO(DAOBase):
             Returns None if no active connection exists.
 
         """
-        conn = await aiosqlite.connect(super().DB_NAME)
-        now = datetime.datetime.now(super().TIMEZONE)
-
-        connection_info = None
-        try:
-            await conn.execute("BEGIN TRANSACTION;")
-
-            # Get current connection info before clearing
-            connection_info = await self._get_current_connection_info(conn)
-
-            if connection_info:
-                # Clear connection status
-                query = """
-                DELETE FROM connection_status
-                WHERE id = 1;
-                """
-
-                await conn.execute(query)
-
-                # Log disconnect event
-                await self._log_history(
-                    conn,
-                    connection_info["channel_id"],
-                    connection_info["guild_id"],
-                    "DISCONNECT",
-                    now,
-                )
-
-            await conn.commit()
-        except Exception as e:
-            try:
-                await conn.rollback()
-            except Exception as rollback_err:
-                logger.error(f"Rollback failed: {rollback_err}")
-            # Try to log error to history as best-effort
+        # Format the timestamp once instead of adapting it on every bind
+        now = datetime.datetime.now(super().TIMEZONE).isoformat(" ")
+        async with self._lock, ConnectionPool.get_instance().write() as conn:
+            connection_info = None
             try:
-                await self._log_history(
-                    conn,
+                await conn.execute("BEGIN IMMEDIATE;")
+
+                # Clear connection status, returning the cleared row if any
+                rows = await conn.execute_fetchall(DELETE_STATUS_QUERY)
+                connection_info = self._to_connection_info(rows)
+
+                await conn.execute("COMMIT;")
+
+                ConnectionDAO._current = None
+                ConnectionDAO._loaded = True
+
+                if connection_info:
+                    # Log disconnect event
+                    self._log_history(
+                        connection_info["channel_id"],
+                        connection_info["guild_id"],
+                        "DISCONNECT",
+                        now,
+                    )
+            except Exception as e:
+                try:
+                    if conn.in_transaction:
+                        await conn.execute("ROLLBACK;")
+                except Exception as rollback_err:
+                    logger.error(f"Rollback failed: {rollback_err}")
+                # Log error to history as best-effort
+                self._log_history(
                     (connection_info["channel_id"] if connection_info else "UNKNOWN"),
                     (connection_info["guild_id"] if connection_info else None),
                     "ERROR",
                     now,
                     f"Disconnect failed: {type(e).__name__}: {e}",
                 )
-                await conn.commit()
-            except Exception as log_err:
-                logger.error(f"Failed to log error: {log_err}")
-            logger.exception("disconnect() failed")
-            raise
-        finally:
-            try:
-                await conn.close()
-            except Exception as close_err:
-                logger.error(f"Failed to close connection: {close_err}")
+                logger.exception("disconnect() failed")
+                raise
 
         return connection_info
 
     async def get_current_connection(self) -> ConnectionInfo | None:
         """Get current connection status.
 
+        The status is served from the in-process mirror, which is loaded from
+        the database on first use.
+
         Returns
         -------
         dict[str, str] | None
@@ -264,19 +263,14 @@ class ConnectionDAO(DAOBase):
             None if not connected.
 
         """
-        conn = await aiosqlite.connect(super().DB_NAME)
-        try:
-            return await self._get_current_connection_info(conn)
-        except aiosqlite.Error:
-            logger.exception("Failed to get current connection")
-            return None
-        except Exception:
-            raise
-        finally:
+        if not self._loaded:
             try:
-                await conn.close()
-            except Exception as close_err:
-                logger.error(f"Failed to close connection: {close_err}")
+                await self._load_current_connection()
+            except aiosqlite.Error:
+                logger.exception("Failed to get current connection")
+                return None
+
+        return None if self._current is None else self._current.copy()
 
     async def is_connected(self) -> bool:
         """Check if bot is currently connected to a voice channel.
@@ -287,8 +281,19 @@ class ConnectionDAO(DAOBase):
             True if connected, False otherwise.
 
         """
-        connection_info = await self.get_current_connection()
-        return connection_info is not None
+        if not self._loaded:
+            return await self.get_current_connection() is not None
+        return self._current is not None
+
+    async def _load_current_connection(self) -> None:
+        """Load the in-process mirror of the status row from the database."""
+        async with self._lock:
+            # Another task may have loaded it while waiting for the lock
+            if self._loaded:
+                return
+            async with ConnectionPool.get_instance().read() as conn:
+                ConnectionDAO._current = await self._get_current_connection_info(conn)
+            ConnectionDAO._loaded = True
 
     async def _get_current_connection_info(
         self,
@@ -307,15 +312,26 @@ class ConnectionDAO(DAOBase):
             Connection information dictionary or None.
 
         """
-        query = """
-        SELECT channel_id, guild_id, connected_at, last_updated
-        FROM connection_status
-        WHERE id = 1;
-        """
-        cursor = await conn.execute(query)
-        row = await cursor.fetchone()
+        # Execute and fetch in a single hop to the connection's thread
+        rows = await conn.execute_fetchall(SELECT_STATUS_QUERY)
+        return self._to_connection_info(rows)
 
-        if row:
+    @staticmethod
+    def _to_connection_info(rows: Iterable[aiosqlite.Row]) -> ConnectionInfo | None:
+        """Convert the status row returned by a query to connection info.
+
+        Parameters
+        ----------
+        rows : Iterable[aiosqlite.Row]
+            Rows of channel_id, guild_id, connected_at and last_updated.
+
+        Returns
+        -------
+        dict[str, str] | None
+            Connection information dictionary, or None if there is no row.
+
+        """
+        for row in rows:
             return {
                 "channel_id": row[0],
                 "guild_id": row[1],
@@ -324,71 +340,85 @@ class ConnectionDAO(DAOBase):
             }
         return None
 
-    async def _log_disconnect_if_exists(
+    def _log_history(
         self,
-        conn: aiosqlite.Connection,
-        timestamp: datetime.datetime,
-    ) -> None:
-        """Log existing connection as disconnected if it exists.
-
-        Parameters
-        ----------
-        conn : aiosqlite.Connection
-            Database connection to use.
-        timestamp : datetime.datetime
-            Timestamp for the disconnect event.
-
-        """
-        connection_info = await self._get_current_connection_info(conn)
-        if connection_info:
-            await self._log_history(
-                conn,
-                connection_info["channel_id"],
-                connection_info["guild_id"],
-                "DISCONNECT",
-                timestamp,
-                "Disconnected due to new connection",
-            )
-
-    async def _log_history(  # noqa: PLR0913
-        self,
-        conn: aiosqlite.Connection,
         channel_id: str,
         guild_id: str | None,
         action: str,
-        timestamp: datetime.datetime,
+        timestamp: str,
         error_message: str | None = None,
     ) -> None:
-        """Log connection event to history table.
+        """Queue a connection event for the history table.
+
+        The event is written in a batch by a background task, so the caller
+        never waits for the database.
 
         Parameters
         ----------
-        conn : aiosqlite.Connection
-            Database connection to use.
         channel_id : str
             ID of the voice channel.
         guild_id : str | None
             ID of the guild.
         action : str
             Action type ('CONNECT', 'DISCONNECT', 'ERROR').
-        timestamp : datetime.datetime
+        timestamp : str
             When the event occurred.
         error_message : str | None
             Error message if action is 'ERROR'.
 
         """
-        query = """
-        INSERT INTO connection_history
-        (channel_id, guild_id, action, timestamp, error_message)
-        VALUES (?, ?, ?, ?, ?);
-        """
-        await conn.execute(
-            query,
-            (
-                channel_id,
-                guild_id,
-                action,
-                timestamp,
-                error_message,
-            ),
+        self._pending_history.put_nowait(
+            (channel_id, guild_id, action, timestamp, error_message),
         )
+
+        if ConnectionDAO._history_writer is None or ConnectionDAO._history_writer.done():
+            ConnectionDAO._history_writer = asyncio.create_task(self._write_pending_history())
+
+    async def flush_history(self) -> None:
+        """Write all queued history events and stop the background writer."""
+        if ConnectionDAO._history_writer is None:
+            return
+
+        await self._pending_history.join()
+
+        ConnectionDAO._history_writer.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await ConnectionDAO._history_writer
+        ConnectionDAO._history_writer = None
+
+    async def _write_pending_history(self) -> None:
+        """Drain queued history events in batches of up to HISTORY_BATCH_SIZE."""
+        loop = asyncio.get_running_loop()
+        while True:
+            rows = [await self._pending_history.get()]
+            deadline = loop.time() + HISTORY_FLUSH_INTERVAL
+            while len(rows) < HISTORY_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    rows.append(await asyncio.wait_for(self._pending_history.get(), timeout))
+                except TimeoutError:
+                    break
+
+            try:
+                await self._insert_history(rows)
+            except Exception:
+                logger.exception("Failed to write connection history")
+            finally:
+                for _ in rows:
+                    self._pending_history.task_done()
+
+    async def _insert_history(self, rows: list[HistoryRow]) -> None:
+        """Insert history events in a single transaction.
+
+        Parameters
+        ----------
+        rows : list[HistoryRow]
+            Rows of (channel_id, guild_id, action, timestamp, error_message).
+
+        """
+        async with ConnectionPool.get_instance().write() as conn:
+            await conn.execute("BEGIN IMMEDIATE;")
+            await conn.executemany(INSERT_HISTORY_QUERY, rows)
+            await conn.execute("COMMIT;")
@@ -14,10 +14,6 @@ class InstructionDAO(DAOBase):
 
     async def create_table(self) -> None:
         """Create table if it doesn't exist."""
-        if not self.validate_table_name(self.TABLE_NAME):
-            msg = "INVALID TABLENAME: Only alphanumeric characters and underscores are allowed."
-            raise ValueError(msg)
-
         conn = await aiosqlite.connect(super().DB_NAME)
         try:
             query = f"""
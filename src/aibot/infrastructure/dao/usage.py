@@ -1,9 +1,17 @@
+import asyncio
+import contextlib
 import datetime
+from collections import Counter
 
 import aiosqlite
 
+from src.aibot.logger import logger
+
 from .base import DAOBase
 
+# Maximum number of usage events written in one transaction
+USAGE_BATCH_SIZE = 64
+
 
 class UsageDAO(DAOBase):
     """Data Access Object for managing usage records.
@@ -20,19 +28,17 @@ class UsageDAO(DAOBase):
     USER_LIMITS_TABLE_NAME: str = "user_limits"
     USAGE_TRACKING_TABLE_NAME: str = "usage_tracking"
 
-    async def create_user_limits_table(self) -> None:
-        """Create table for managing user limits if it doesn't exist.
-
-        Raises
-        ------
-        ValueError
-            If the table name contains invalid characters.
+    def __init__(self) -> None:
+        self._pending_usage: asyncio.Queue[int] = asyncio.Queue()
+        self._usage_writer: asyncio.Task[None] | None = None
 
-        """
-        if not self.validate_table_name(self.USER_LIMITS_TABLE_NAME):
-            msg = "INVALID TABLENAME: Only alphanumeric characters and underscores are allowed."
-            raise ValueError(msg)
+    @classmethod
+    def get_instance(cls) -> "UsageDAO":
+        """Get the singleton instance."""
+        return _USAGE_DAO
 
+    async def create_user_limits_table(self) -> None:
+        """Create table for managing user limits if it doesn't exist."""
         conn = await aiosqlite.connect(super().DB_NAME)
         try:
             query = f"""
@@ -49,18 +55,7 @@ class UsageDAO(DAOBase):
             await conn.close()
 
     async def create_usage_tracking_table(self) -> None:
-        """Create table for tracking API usage if it doesn't exist.
-
-        Raises
-        ------
-        ValueError
-            If the table name contains invalid characters.
-
-        """
-        if not self.validate_table_name(self.USAGE_TRACKING_TABLE_NAME):
-            msg = "INVALID TABLENAME: Only alphanumeric characters and underscores are allowed."
-            raise ValueError(msg)
-
+        """Create table for tracking API usage if it doesn't exist."""
         conn = await aiosqlite.connect(super().DB_NAME)
         try:
             query = f"""
@@ -196,6 +191,75 @@ class UsageDAO(DAOBase):
         finally:
             await conn.close()
 
+    def record_async(self, user_id: int) -> None:
+        """Record a usage event without waiting for the database write.
+
+        Events are queued and written in batches by a background task.
+
+        Parameters
+        ----------
+        user_id : int
+            ID of the user.
+
+        """
+        self._pending_usage.put_nowait(user_id)
+
+        if self._usage_writer is None or self._usage_writer.done():
+            self._usage_writer = asyncio.create_task(self._write_pending_usage())
+
+    async def flush(self) -> None:
+        """Write all queued usage events and stop the background writer."""
+        if self._usage_writer is None:
+            return
+
+        await self._pending_usage.join()
+
+        self._usage_writer.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._usage_writer
+        self._usage_writer = None
+
+    async def _write_pending_usage(self) -> None:
+        """Drain queued usage events in batches of up to USAGE_BATCH_SIZE."""
+        while True:
+            user_ids = [await self._pending_usage.get()]
+            while len(user_ids) < USAGE_BATCH_SIZE and not self._pending_usage.empty():
+                user_ids.append(self._pending_usage.get_nowait())
+
+            try:
+                await self._add_daily_usage_counts(Counter(user_ids))
+            except Exception:
+                logger.exception("Failed to write %d usage events", len(user_ids))
+            finally:
+                for _ in user_ids:
+                    self._pending_usage.task_done()
+
+    async def _add_daily_usage_counts(self, counts: Counter[int]) -> None:
+        """Add usage counts for multiple users on the current day.
+
+        Parameters
+        ----------
+        counts : Counter[int]
+            Number of calls to add, keyed by user ID.
+
+        """
+        conn = await aiosqlite.connect(super().DB_NAME)
+        today = datetime.datetime.now(super().TIMEZONE).date()
+        try:
+            query = """
+            INSERT INTO usage_tracking (user_id, usage_date, usage_count)
+            VALUES (?, ?, ?)
+            ON CONFLICT(user_id, usage_date) DO UPDATE SET
+                usage_count = usage_count + excluded.usage_count;
+            """
+            await conn.executemany(
+                query,
+                [(user_id, today, count) for user_id, count in counts.items()],
+            )
+            await conn.commit()
+        finally:
+            await conn.close()
+
     async def RESET(self) -> None:  # noqa: N802
         """Reset daily usage counts by removing records from yesterday."""
         conn = await aiosqlite.connect(super().DB_NAME)
@@ -210,3 +274,7 @@ class UsageDAO(DAOBase):
             await conn.commit()
         finally:
             await conn.close()
+
+
+# The singleton instance, created once at import time
+_USAGE_DAO = UsageDAO()
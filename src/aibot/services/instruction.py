@@ -42,6 +42,8 @@ class InstructionService:
             return
         self._dao = InstructionDAO()
         self._gen_dir = self._instructions_dir / "gen"
+        # Parsed static instructions and the file mtime they were read at
+        self._static_instructions: tuple[float, dict[str, Any]] | None = None
         self._ensure_directory()
         self._initialized = True
 
@@ -80,19 +82,30 @@ class InstructionService:
         return sorted(txt_files, key=lambda f: f.stat().st_mtime, reverse=True)
 
     def load_static_instruction(self, command_name: str) -> str | None:
-        """Load static instructions from YAML file."""
-        if not self._static_instruction_file.exists():
+        """Load static instructions from YAML file.
+
+        The parsed file is cached and only re-read when its modification
+        time changes.
+        """
+        try:
+            mtime = self._static_instruction_file.stat().st_mtime
+        except FileNotFoundError:
             logger.warning("Static instruction file not found: %s", self._static_instruction_file)
             return None
 
+        if self._static_instructions is not None and self._static_instructions[0] == mtime:
+            return self._static_instructions[1].get(command_name)
+
         try:
             with self._static_instruction_file.open("r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-                return data.get(command_name) if data else None
+                data = yaml.safe_load(f) or {}
         except Exception as e:
             logger.error("Failed to load static instructions: %s", e)
             return None
 
+        self._static_instructions = (mtime, data)
+        return data.get(command_name)
+
     async def create_and_activate_instruction(
         self,
         content: str,
@@ -1,74 +1,100 @@
 import json
+from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 from discord import app_commands
 
 from src.aibot.logger import logger
-from src.aibot.services.provider import ProviderManager, ProviderType
+from src.aibot.services.provider import ProviderManager, ProviderType, parse_provider
 
+# Model configuration file, located relative to the repository root
+CONFIG_PATH = Path(__file__).resolve().parents[3] / "resources" / "llm-models.json"
 
+
+@dataclass(slots=True, frozen=True)
 class ModelConfig:
     """Model configuration class."""
 
-    def __init__(self, config_dict: dict[str, Any]) -> None:
-        """Initialize model config from dictionary.
+    id: str
+    display_name: str
+    provider: ProviderType
+    params: dict[str, Any]
+
+    @classmethod
+    def from_dict(cls, config_dict: dict[str, Any]) -> "ModelConfig":
+        """Create model config from dictionary.
 
         Parameters
         ----------
         config_dict : dict[str, Any]
             Model configuration dictionary from JSON.
 
+        Returns
+        -------
+        ModelConfig
+            The model configuration.
+
         """
-        self.id: str = config_dict["id"]
-        self.display_name: str = config_dict["display_name"]
-        self.provider: ProviderType = config_dict["provider"]
-        self.params: dict[str, Any] = config_dict["params"]
+        return cls(
+            id=config_dict["id"],
+            display_name=config_dict["display_name"],
+            provider=parse_provider(config_dict["provider"]),
+            params=config_dict["params"],
+        )
 
 
 class ModelResolver:
     """Resolves model selection for Discord commands based on configuration."""
 
-    _config_cache: dict[str, Any] | None = None
-    _instance: "ModelResolver | None" = None
-
-    def __new__(cls) -> "ModelResolver":
-        """Create or return the singleton instance."""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+    def __init__(self) -> None:
+        self._models: MappingProxyType[str, tuple[ModelConfig, ...]] | None = None
+        self._choices: MappingProxyType[str, tuple[app_commands.Choice[str], ...]] | None = None
+        self._resolved_models: dict[tuple[str, str | None, ProviderType], ModelConfig] = {}
 
     @classmethod
     def get_instance(cls) -> "ModelResolver":
         """Get the singleton instance."""
-        if cls._instance is None:
-            cls._instance = cls()
-        return cls._instance
-
-    def _load_config(self) -> dict[str, Any]:
-        """Load model configuration from JSON file."""
-        if self._config_cache is not None:
-            return self._config_cache
-
-        current_path = Path(__file__).resolve()
-        config_path = None
+        return _RESOLVER
 
-        for parent in current_path.parents:
-            if (parent / "pyproject.toml").exists():
-                config_path = parent / "resources" / "llm-models.json"
-                break
+    def _load_models(self) -> MappingProxyType[str, tuple[ModelConfig, ...]]:
+        """Load model configurations from JSON file, keyed by section name."""
+        if self._models is not None:
+            return self._models
 
-        if config_path is None or not config_path.exists():
+        if not CONFIG_PATH.exists():
             msg = "llm-models.json not found"
             logger.error(msg)
             raise FileNotFoundError(msg)
 
-        with config_path.open() as f:
-            self._config_cache = json.load(f)
-
-        return self._config_cache
-
-    def get_models_for_command(self, command_name: str) -> list[ModelConfig]:
+        config: dict[str, list[dict[str, Any]]] = json.loads(CONFIG_PATH.read_bytes())
+
+        self._models = MappingProxyType(
+            {
+                key: tuple(ModelConfig.from_dict(model_dict) for model_dict in model_dicts)
+                for key, model_dicts in config.items()
+            },
+        )
+        return self._models
+
+    def _load_choices(self) -> MappingProxyType[str, tuple[app_commands.Choice[str], ...]]:
+        """Build the Discord choices of every model section once, keyed by section name."""
+        if self._choices is not None:
+            return self._choices
+
+        self._choices = MappingProxyType(
+            {
+                key: tuple(
+                    app_commands.Choice(name=model.display_name, value=model.id)
+                    for model in models
+                )
+                for key, models in self._load_models().items()
+            },
+        )
+        return self._choices
+
+    def get_models_for_command(self, command_name: str) -> tuple[ModelConfig, ...]:
         """Get available models for a specific command.
 
         Parameters
@@ -78,30 +104,22 @@ class ModelResolver:
 
         Returns
         -------
-        list[ModelConfig]
-            List of available models for the command.
+        tuple[ModelConfig, ...]
+            Available models for the command, empty if none are configured.
 
         """
-        config = self._load_config()
-        command_key = f"{command_name}_models"
-
-        if command_key in config:
-            return [ModelConfig(model_dict) for model_dict in config[command_key]]
+        return self._load_models().get(f"{command_name}_models", ())
 
-        # Return empty list if no specific models for command
-        return []
-
-    def get_default_models(self) -> list[ModelConfig]:
+    def get_default_models(self) -> tuple[ModelConfig, ...]:
         """Get default models.
 
         Returns
         -------
-        list[ModelConfig]
-            List of default models.
+        tuple[ModelConfig, ...]
+            Default models.
 
         """
-        config = self._load_config()
-        return [ModelConfig(model_dict) for model_dict in config.get("default_models", [])]
+        return self._load_models().get("default_models", ())
 
     def resolve_model_for_command(
         self,
@@ -122,10 +140,40 @@ class ModelResolver:
         ModelConfig
             The resolved model configuration.
 
+        """
+        current_provider = ProviderManager.get_instance().get_provider()
+
+        cache_key = (command_name, selected_model_id, current_provider)
+        model = self._resolved_models.get(cache_key)
+        if model is None:
+            model = self._resolve_model(command_name, selected_model_id, current_provider)
+            self._resolved_models[cache_key] = model
+        return model
+
+    def _resolve_model(
+        self,
+        command_name: str,
+        selected_model_id: str | None,
+        current_provider: ProviderType,
+    ) -> ModelConfig:
+        """Resolve the model for a command without using the cache.
+
+        Parameters
+        ----------
+        command_name : str
+            The name of the Discord command.
+        selected_model_id : str | None
+            Optionally selected model ID from UI choices.
+        current_provider : ProviderType
+            The currently selected provider.
+
+        Returns
+        -------
+        ModelConfig
+            The resolved model configuration.
+
         """
         command_models = self.get_models_for_command(command_name)
-        provider_manager = ProviderManager.get_instance()
-        current_provider = provider_manager.get_provider()
 
         # If specific model is selected from UI choices, use it
         if selected_model_id is not None and command_models:
@@ -171,7 +219,10 @@ class ModelResolver:
         logger.error(msg)
         raise ValueError(msg)
 
-    def get_choices_for_command(self, command_name: str) -> list[app_commands.Choice[str]]:
+    def get_choices_for_command(
+        self,
+        command_name: str,
+    ) -> tuple[app_commands.Choice[str], ...]:
         """Get Discord app_commands choices for a command.
 
         Parameters
@@ -181,15 +232,11 @@ class ModelResolver:
 
         Returns
         -------
-        list[app_commands.Choice[str]]
-            List of choices for the command.
+        tuple[app_commands.Choice[str], ...]
+            Choices for the command, empty if no models are configured.
 
         """
-        command_models = self.get_models_for_command(command_name)
-        return [
-            app_commands.Choice(name=model.display_name, value=model.id)
-            for model in command_models
-        ]
+        return self._load_choices().get(f"{command_name}_models", ())
 
 
 def get_model_choices(command_name: str) -> list[app_commands.Choice[str]]:
@@ -217,4 +264,9 @@ def get_model_choices(command_name: str) -> list[app_commands.Choice[str]]:
 
     """
     resolver = ModelResolver.get_instance()
-    return resolver.get_choices_for_command(command_name)
+    # The decorator expects a list, so hand out a copy of the shared tuple
+    return list(resolver.get_choices_for_command(command_name))
+
+
+# The singleton instance, created once at import time
+_RESOLVER = ModelResolver()
@@ -1,8 +1,56 @@
-from typing import Literal
+from enum import IntEnum
+from typing import Final
 
 from src.aibot.logger import logger
 
-ProviderType = Literal["anthropic", "google", "openai"]
+
+class ProviderType(IntEnum):
+    """AI provider.
+
+    A small-integer enum, so comparing providers is an integer comparison.
+    """
+
+    ANTHROPIC = 0
+    GOOGLE = 1
+    OPENAI = 2
+
+    def __str__(self) -> str:
+        """Return the lowercase name, as used in configuration files."""
+        return self.name.lower()
+
+
+_PROVIDERS_BY_NAME: Final[dict[str, ProviderType]] = {str(p): p for p in ProviderType}
+_DISPLAY_NAMES: Final[dict[ProviderType, str]] = {
+    ProviderType.ANTHROPIC: "Anthropic",
+    ProviderType.GOOGLE: "Google (Gemini)",
+    ProviderType.OPENAI: "OpenAI",
+}
+
+
+def parse_provider(name: str) -> ProviderType:
+    """Parse a provider name.
+
+    Parameters
+    ----------
+    name : str
+        The provider name (anthropic, google, openai).
+
+    Returns
+    -------
+    ProviderType
+        The provider.
+
+    Raises
+    ------
+    ValueError
+        If the name is not a known provider.
+
+    """
+    provider = _PROVIDERS_BY_NAME.get(name)
+    if provider is None:
+        msg = f"Invalid provider: {name}. Must be one of: anthropic, google, openai"
+        raise ValueError(msg)
+    return provider
 
 
 class ProviderManager:
@@ -10,34 +58,25 @@ class ProviderManager:
 
     Attributes
     ----------
-    _instance : ProviderManager | None
-        The singleton instance of the ProviderManager.
     provider : ProviderType
         The current AI provider.
 
     """
 
-    _instance: "ProviderManager | None" = None
-    provider: ProviderType = "google"  # Default
+    __slots__ = ("provider",)
 
-    def __new__(cls) -> "ProviderManager":
-        """Create or return the singleton instance."""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+    def __init__(self) -> None:
+        self.provider = ProviderType.GOOGLE  # Default
 
     @classmethod
     def get_instance(cls) -> "ProviderManager":
         """Get the singleton instance."""
-        if cls._instance is None:
-            cls._instance = cls()
-        return cls._instance
+        return _PROVIDER_MANAGER
 
-    def set_provider(self, provider: ProviderType) -> None:
-        """Set the current AI provider."""
-        if provider not in ["anthropic", "google", "openai"]:
-            msg = f"Invalid provider: {provider}. Must be one of: anthropic, google, openai"
-            raise ValueError(msg)
+    def set_provider(self, provider: ProviderType | str) -> None:
+        """Set the current AI provider, given as the enum or its name."""
+        if not isinstance(provider, ProviderType):
+            provider = parse_provider(provider)
 
         self.provider = provider
         logger.info("AI provider changed to: %s", provider)
@@ -48,9 +87,8 @@ class ProviderManager:
 
     def get_provider_display_name(self) -> str:
         """Get the display name of the current provider."""
-        display_names = {
-            "anthropic": "Anthropic",
-            "google": "Google (Gemini)",
-            "openai": "OpenAI",
-        }
-        return display_names[self.provider]
+        return _DISPLAY_NAMES[self.provider]
+
+
+# The singleton instance, created once at import time
+_PROVIDER_MANAGER = ProviderManager()